@@ -1,111 +1,660 @@
 """CLI wrapper utilities for enoch binary."""
 
+import asyncio
+import contextvars
+import functools
+import importlib.resources
+import inspect
 import json
+import os
+import queue
+import re
+import shutil
 import subprocess
-from pathlib import Path
-from typing import Optional
-
-
-def find_enoch_binary() -> str:
-    """Find enoch binary in PATH or relative to this package."""
-    # Try PATH first
-    result = subprocess.run(["which", "enoch"], capture_output=True, text=True)
-    if result.returncode == 0:
-        return result.stdout.strip()
+import threading
+import weakref
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, NamedTuple, Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Development build, relative to the repository root
+_DEV_BINARY = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "target", "release", "enoch")
+)
+
+# Canonical rules questions mapped to enoch's own --query answers; keep in
+# step with query_rules() in src/main.rs
+_RULES: dict[str, str] = json.loads(
+    importlib.resources.files(__package__).joinpath("rules.json").read_text(encoding="utf-8")
+)
+_RULES_PUNCT_RE = re.compile(r"[^\w ]+")
+
+# Framing used by `enoch --headless --serve`
+SERVE_BANNER = "ENOCH-SERVE 1"
+SERVE_SENTINEL = "---END---"
+
+# Printed by `enoch --emit-state` before the new game state
+STATE_MARKER = "---STATE---"
+
+# Output parsers, one pattern per command
+_VALIDATE_RE = re.compile(r"^\s*(?:Piece:\s*(?P<piece>.+?)|Captures:\s*(?P<captures>.+?))\s*$", re.M)
+_ANALYZE_RE = re.compile(
+    r"^(?:Piece:\s*(?P<piece>.+?)|Status:\s*(?P<status>.+?)|(?P<empty>Empty square)"
+    r"|(?P<moves_header>Legal moves).*|[ \t]+(?P<move>\S+).*)\s*$",
+    re.M,
+)
+_ARMY = r"Blue|Red|Black|Yellow"
+_STATUS_RE = re.compile(
+    rf"^(?:Current turn:\s*(?P<turn>.+?)|\s*(?P<army>{_ARMY}):\s*(?P<status>.+?)"
+    r"|.*Winner:\s*(?P<winner>.+?))\s*$",
+    re.M,
+)
+_STATS_RE = re.compile(
+    rf"^\s*(?:Moves played:\s*(?P<moves>\d+)|(?P<lost_army>{_ARMY}) lost:\s*(?P<lost>.+?)"
+    rf"|(?P<army>{_ARMY}):\s*(?P<status>Active|Frozen|In Check))\s*$",
+    re.M,
+)
+_PERFT_RE = re.compile(
+    r"^(?:Nodes:\s*(?P<nodes>\d+)|Time:\s*(?P<time>[\d.]+)s?|NPS:\s*(?P<nps>[\d.]+))\s*$", re.M
+)
+_ARRAY_RE = re.compile(r"^\d+\.\s*(?P<name>.+?)[ \t]*\n[ \t]*(?P<description>.*?)\s*$", re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_enoch_binary() -> str:
+    # Explicit override wins
+    override = os.environ.get("ENOCH_BINARY")
+    if override:
+        if os.path.isfile(override):
+            return override
+        raise FileNotFoundError(f"ENOCH_BINARY points to a missing file: {override}")
+
+    # Try PATH next
+    path = shutil.which("enoch")
+    if path:
+        return path
     
     # Try relative path (development mode)
-    repo_root = Path(__file__).parent.parent.parent.parent
-    binary = repo_root / "target" / "release" / "enoch"
-    if binary.exists():
-        return str(binary)
+    if os.path.isfile(_DEV_BINARY):
+        return _DEV_BINARY
     
-    raise FileNotFoundError("enoch binary not found in PATH or target/release/")
+    raise FileNotFoundError("enoch binary not found in ENOCH_BINARY, PATH or target/release/")
 
 
-def run_enoch(args: list[str]) -> tuple[str, str, int]:
-    """Run enoch CLI and return (stdout, stderr, returncode)."""
+def find_enoch_binary() -> str:
+    """Find enoch binary, resolving it once and re-resolving if it disappears."""
+    binary = _resolve_enoch_binary()
+    if not os.path.isfile(binary):
+        _resolve_enoch_binary.cache_clear()
+        binary = _resolve_enoch_binary()
+    return binary
+
+
+def _can_frame(args: list[str], stdin: Optional[bytes] = None) -> bool:
+    """Whether args and stdin survive the tab/newline framing used by --serve."""
+    if stdin is not None and (b"\r" in stdin or stdin.find(b"\n") != len(stdin) - 1):
+        return False
+    return not any(c in arg for arg in args for c in "\t\r\n")
+
+
+def _pump_lines(pipe, lines: queue.SimpleQueue) -> None:
+    """Forward each line read from pipe to lines, then None at EOF."""
+    for raw in iter(pipe.readline, b""):
+        lines.put(raw.decode("utf-8", "replace"))
+    lines.put(None)
+
+
+class _EnochSession:
+    """Long-lived `enoch --headless --serve` process fed one command per line."""
+
+    def __init__(self, binary: str):
+        self.binary = binary
+        self.supported = True
+        self.proc: Optional[subprocess.Popen] = None
+        self.stderr_lines: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self.lock = threading.Lock()
+
+    def _start(self) -> bool:
+        proc = subprocess.Popen(
+            [self.binary, "--headless", "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        banner = proc.stdout.readline().decode("utf-8", "replace").strip()
+        if banner != SERVE_BANNER:
+            # Binary predates --serve; stick to one process per call
+            proc.kill()
+            proc.wait()
+            self.supported = False
+            return False
+        self.proc = proc
+        # Drain stderr all the time; a command that fills the stderr pipe
+        # would otherwise block while we are still waiting on its stdout
+        self.stderr_lines = queue.SimpleQueue()
+        threading.Thread(target=_pump_lines, args=(proc.stderr, self.stderr_lines), daemon=True).start()
+        return True
+
+    def _discard(self) -> int:
+        proc, self.proc = self.proc, None
+        proc.kill()
+        return proc.wait()
+
+    def close(self) -> None:
+        """Stop the served process, if one is running."""
+        with self.lock:
+            if self.proc is not None:
+                self._discard()
+
+    def call(
+        self,
+        args: list[str],
+        on_line: Optional[Callable[[str], None]] = None,
+        stdin: Optional[bytes] = None,
+    ) -> Optional[tuple[str, str, int]]:
+        """Run one command, or return None if it can't go through the session.
+
+        on_line, if given, receives each stdout line as soon as it is read,
+        and the returned stdout is then empty rather than a second copy.
+        stdin is one newline-terminated line sent after the command.
+        """
+        if not _can_frame(args, stdin):
+            return None
+
+        with self.lock:
+            if self.proc is None or self.proc.poll() is not None:
+                if not self.supported or not self._start():
+                    return None
+
+            proc = self.proc
+            try:
+                proc.stdin.write(("\t".join(args) + "\n").encode("utf-8") + (stdin or b""))
+                proc.stdin.flush()
+            except BrokenPipeError:
+                self._discard()
+                return None
+
+            out_lines = []
+            code = None
+            for raw in iter(proc.stdout.readline, b""):
+                line = raw.decode("utf-8", "replace")
+                if line.startswith(SERVE_SENTINEL + "\t"):
+                    code = int(line.rstrip().split("code=")[1])
+                    break
+                if on_line is not None:
+                    on_line(line)
+                else:
+                    out_lines.append(line)
+
+            if code is None:
+                # Command exited the process (e.g. an illegal move)
+                self.proc = None
+                code = proc.wait()
+                return "".join(out_lines), "".join(iter(self.stderr_lines.get, None)), code
+
+            err_lines = []
+            while (line := self.stderr_lines.get()) is not None and line.rstrip() != SERVE_SENTINEL:
+                err_lines.append(line)
+
+            return "".join(out_lines), "".join(err_lines), code
+
+
+class _EnochPool:
+    """Up to `size` enoch sessions, each serving one command at a time.
+
+    Sessions are started on demand, so a single caller keeps using one
+    process and extra ones only appear under concurrent load.
+    """
+
+    def __init__(self, binary: str, size: int):
+        self.binary = binary
+        self.size = size
+        self.supported = True
+        self.idle: "queue.SimpleQueue[_EnochSession]" = queue.SimpleQueue()
+        self.created = 0
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def _acquire(self) -> _EnochSession:
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if self.created < self.size:
+                self.created += 1
+                return _EnochSession(self.binary)
+        return self.idle.get()
+
+    def _release(self, session: _EnochSession) -> None:
+        with self.lock:
+            if not self.closed:
+                self.idle.put(session)
+                return
+        session.close()
+
+    def call(
+        self,
+        args: list[str],
+        on_line: Optional[Callable[[str], None]] = None,
+        stdin: Optional[bytes] = None,
+    ) -> Optional[tuple[str, str, int]]:
+        """Run one command on an idle session; see _EnochSession.call."""
+        if not self.supported:
+            return None
+
+        session = self._acquire()
+        try:
+            # A session whose process died restarts itself on its next call
+            return session.call(args, on_line, stdin)
+        finally:
+            if not session.supported:
+                self.supported = False
+            self._release(session)
+
+    def close(self) -> None:
+        """Stop idle sessions now and busy ones as soon as they are released."""
+        with self.lock:
+            self.closed = True
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pool: Optional[_EnochPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(binary: str) -> _EnochPool:
+    """Return the shared session pool, starting over if the binary changed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.binary != binary:
+            if _pool is not None:
+                _pool.close()
+            _pool = _EnochPool(binary, os.cpu_count() or 1)
+        return _pool
+
+
+_spawn_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _spawn_limit() -> asyncio.Semaphore:
+    """Per-loop cap on concurrently spawned enoch processes."""
+    loop = asyncio.get_running_loop()
+    limit = _spawn_limits.get(loop)
+    if limit is None:
+        limit = _spawn_limits[loop] = asyncio.Semaphore(os.cpu_count() or 1)
+    return limit
+
+
+async def _spawn(binary: str, args: list[str], stdin: Optional[bytes] = None) -> tuple[str, str, int]:
+    """Run one enoch process to completion."""
+    async with _spawn_limit():
+        proc = await asyncio.create_subprocess_exec(
+            binary,
+            *args,
+            stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate(stdin)
+    return stdout.decode("utf-8", "replace"), stderr.decode("utf-8", "replace"), proc.returncode
+
+
+async def _run_served_batch(
+    binary: str, commands: list[tuple[list[str], Optional[bytes]]]
+) -> list[tuple[str, str, int]]:
+    """Run (args, stdin) commands in order through one --serve process."""
+    if not commands:
+        return []
+    if not all(_can_frame(args, stdin) for args, stdin in commands):
+        return [await _spawn(binary, args, stdin) for args, stdin in commands]
+
+    script = b"".join(("\t".join(args) + "\n").encode("utf-8") + (stdin or b"") for args, stdin in commands)
+    stdout, stderr, code = await _spawn(binary, ["--headless", "--serve"], script)
+
+    out_lines = stdout.splitlines(keepends=True)
+    if not out_lines or out_lines[0].strip() != SERVE_BANNER:
+        return [await _spawn(binary, args, stdin) for args, stdin in commands]
+
+    results = []
+    out_frame: list[str] = []
+    err_frames = stderr.split(SERVE_SENTINEL + "\n")
+    for line in out_lines[1:]:
+        if line.startswith(SERVE_SENTINEL + "\t"):
+            err = err_frames[len(results)] if len(results) < len(err_frames) else ""
+            results.append(("".join(out_frame), err, int(line.rstrip().split("code=")[1])))
+            out_frame = []
+        else:
+            out_frame.append(line)
+
+    if len(results) < len(commands):
+        # A command exited the process; it owns the trailing output and the
+        # exit code, and everything after it runs in a fresh process
+        results.append(("".join(out_frame), err_frames[-1], code))
+        results.extend(await _run_served_batch(binary, commands[len(results):]))
+    return results
+
+
+class _CommandBatch:
+    """run_enoch calls collected from coroutines started by gather_batched."""
+
+    def __init__(self):
+        self.pending: list[tuple[tuple[list[str], Optional[bytes]], asyncio.Future]] = []
+        self.changed = asyncio.Event()
+
+    def submit(self, args: list[str], stdin: Optional[bytes] = None) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append(((args, stdin), future))
+        self.changed.set()
+        return future
+
+    async def flush(self) -> None:
+        pending, self.pending = self.pending, []
+        try:
+            results = await _run_served_batch(find_enoch_binary(), [command for command, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            future.set_result(result)
+
+
+_current_batch: contextvars.ContextVar[Optional[_CommandBatch]] = contextvars.ContextVar(
+    "enoch_batch", default=None
+)
+
+
+async def gather_batched(*coros):
+    """Await cli coroutines, running their enoch commands in one process.
+
+    Commands run in the order the coroutines are given, so a move followed by
+    a status query sees the move.
+    """
+    batch = _CommandBatch()
+    token = _current_batch.set(batch)
+    try:
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+    finally:
+        _current_batch.reset(token)
+
+    for task in tasks:
+        task.add_done_callback(lambda _: batch.changed.set())
+
+    # Flush once every unfinished task is parked on a batched command
+    while not all(task.done() for task in tasks):
+        if sum(not task.done() for task in tasks) > len(batch.pending):
+            batch.changed.clear()
+            await batch.changed.wait()
+        else:
+            await batch.flush()
+
+    return await asyncio.gather(*tasks)
+
+
+async def run_enoch(args: list[str], stdin: Optional[bytes] = None) -> tuple[str, str, int]:
+    """Run enoch CLI and return (stdout, stderr, returncode).
+
+    stdin, if given, is a single line such as the state read by `--state -`.
+    """
+    batch = _current_batch.get()
+    if batch is not None:
+        return await batch.submit(args, stdin)
+
     binary = find_enoch_binary()
-    result = subprocess.run(
-        [binary] + args,
-        capture_output=True,
-        text=True
-    )
-    return result.stdout, result.stderr, result.returncode
+    served = await asyncio.to_thread(_get_pool(binary).call, args, None, stdin)
+    if served is not None:
+        return served
+
+    return await _spawn(binary, args, stdin)
 
 
-def validate_move(move: str, state_file: Optional[str] = None) -> dict:
+async def _stream_enoch(args: list[str], stdin: Optional[bytes] = None) -> AsyncIterator[str]:
+    """Yield enoch's stdout lines, without line endings, as they are produced."""
+    batch = _current_batch.get()
+    if batch is not None:
+        stdout, _, _ = await batch.submit(args, stdin)
+        for line in stdout.splitlines():
+            yield line
+        return
+
+    binary = find_enoch_binary()
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue = asyncio.Queue()
+
+    def on_line(line: str) -> None:
+        loop.call_soon_threadsafe(lines.put_nowait, line)
+
+    served = asyncio.ensure_future(asyncio.to_thread(_get_pool(binary).call, args, on_line, stdin))
+    served.add_done_callback(lambda _: lines.put_nowait(None))
+    while (line := await lines.get()) is not None:
+        yield line.rstrip("\r\n")
+    if served.result() is not None:
+        return
+
+    async with _spawn_limit():
+        proc = await asyncio.create_subprocess_exec(
+            binary,
+            *args,
+            stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        if stdin is not None:
+            proc.stdin.write(stdin)
+            proc.stdin.close()
+        try:
+            async for raw in proc.stdout:
+                yield raw.decode("utf-8", "replace").rstrip("\r\n")
+        finally:
+            if not proc.stdout.at_eof():
+                # Consumer stopped early; don't leave enoch blocked on the pipe
+                proc.kill()
+            await proc.wait()
+
+
+_state_caches: list[OrderedDict] = []
+
+
+def _state_aware_cache(maxsize: int = 1024):
+    """Cache a read-only wrapper on its arguments plus the state file's mtime.
+
+    In-memory state_bytes are part of the arguments, so they key the cache too.
+
+    Hits share the cached dict, so callers must not mutate results.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        cache: OrderedDict = OrderedDict()
+        if "state_file" in signature.parameters:
+            _state_caches.append(cache)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _current_batch.get() is not None:
+                # Earlier commands in the batch may still change the state file
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            state_file = bound.arguments.get("state_file")
+            try:
+                mtime_ns = os.stat(state_file).st_mtime_ns if state_file else None
+            except OSError:
+                mtime_ns = None
+
+            key = (tuple(bound.arguments.items()), mtime_ns)
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            result = await func(*args, **kwargs)
+            cache[key] = result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
+def _invalidates_state_cache(func):
+    """Drop cached state-file reads after a wrapper that changes game state."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            clear_state_cache()
+    return wrapper
+
+
+def clear_state_cache() -> None:
+    """Forget every cached result that depends on a state file."""
+    for cache in _state_caches:
+        cache.clear()
+
+
+def _add_state(
+    args: list[str], state_file: Optional[str], state_bytes: Optional[bytes], emit: bool = False
+) -> Optional[bytes]:
+    """Point args at the game state and return the stdin line to send, if any.
+
+    state_bytes is kept in memory and passed via `--state -` instead of a
+    file; b"" starts a new game. With emit, enoch prints the new state.
+    """
+    if state_bytes is None:
+        if state_file == "-":
+            # A file named "-", not enoch's stdin state; that would wait for a line never sent
+            state_file = "./-"
+        if state_file:
+            args.extend(["--state", state_file])
+        return None
+    args.extend(["--state", "-"])
+    if emit:
+        args.append("--emit-state")
+    state = state_bytes.strip()
+    if b"\n" in state or b"\r" in state:
+        # Pretty-printed state (e.g. a state file) must fit --serve's one line
+        state = json.dumps(_loads(state), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return state + b"\n"
+
+
+def _split_state(stdout: str) -> tuple[str, Optional[bytes]]:
+    """Separate the `--emit-state` block from enoch's regular output."""
+    output, marker, state = stdout.partition(STATE_MARKER + "\n")
+    if not marker:
+        return stdout, None
+    return output, state.strip().encode("utf-8")
+
+
+async def _run_json(args: list[str], stdin: Optional[bytes] = None) -> dict:
+    """Run enoch with --json and decode its report."""
+    stdout, stderr, code = await run_enoch(args + ["--json"], stdin)
+    try:
+        return _loads(stdout)
+    except ValueError:
+        raise RuntimeError(stderr.strip() or stdout.strip() or f"enoch exited with code {code}")
+
+
+async def validate_move(
+    move: str, state_file: Optional[str] = None, legacy: bool = False, state_bytes: Optional[bytes] = None
+) -> dict:
     """Validate a move without applying it."""
     args = ["--headless", "--validate", move]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes)
+    if not legacy:
+        return await _run_json(args, stdin)
     
-    stdout, stderr, code = run_enoch(args)
+    stdout, stderr, code = await run_enoch(args, stdin)
     
     if code == 0:
         # Parse success output
-        lines = stdout.strip().split("\n")
         result = {"valid": True, "piece": None, "captures": None}
-        for line in lines:
-            if "Piece:" in line:
-                result["piece"] = line.split("Piece:")[1].strip()
-            elif "Captures:" in line:
-                result["captures"] = line.split("Captures:")[1].strip()
+        for m in _VALIDATE_RE.finditer(stdout):
+            if m["piece"] is not None:
+                result["piece"] = m["piece"]
+            else:
+                result["captures"] = m["captures"]
         return result
     else:
         # Parse error
         return {"valid": False, "reason": stdout.strip()}
 
 
-def analyze_square(square: str, state_file: Optional[str] = None) -> dict:
+@_state_aware_cache()
+async def analyze_square(
+    square: str, state_file: Optional[str] = None, legacy: bool = False, state_bytes: Optional[bytes] = None
+) -> dict:
     """Analyze a square and return piece info and legal moves."""
     args = ["--headless", "--analyze", square]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes)
+    if not legacy:
+        return await _run_json(args, stdin)
     
-    stdout, stderr, code = run_enoch(args)
-    lines = stdout.strip().split("\n")
+    stdout, stderr, code = await run_enoch(args, stdin)
     
     result = {"square": square, "piece": None, "status": None, "legal_moves": []}
-    
-    for i, line in enumerate(lines):
-        if "Piece:" in line:
-            result["piece"] = line.split("Piece:")[1].strip()
-        elif "Status:" in line:
-            result["status"] = line.split("Status:")[1].strip()
-        elif "Legal moves" in line:
-            # Collect moves from following lines
-            for move_line in lines[i+1:]:
-                move_line = move_line.strip()
-                if move_line and not move_line.startswith("Analyzing"):
-                    # Extract just the square (e.g., "e3" or "e3 (captures ...)")
-                    move = move_line.split()[0]
-                    result["legal_moves"].append(move)
-        elif "Empty square" in line:
+    in_moves = False
+    
+    for m in _ANALYZE_RE.finditer(stdout):
+        if m["move"] is not None:
+            # Indented lines after the header: "e3" or "e3 (captures ...)"
+            if in_moves:
+                result["legal_moves"].append(m["move"])
+        elif m["moves_header"] is not None:
+            in_moves = True
+        elif m["piece"] is not None:
+            result["piece"] = m["piece"]
+        elif m["status"] is not None:
+            result["status"] = m["status"]
+        else:
             result["piece"] = None
             result["status"] = "empty"
     
     return result
 
 
-def query_rules(query: str) -> dict:
+@_state_aware_cache(maxsize=256)
+async def query_rules(query: str) -> dict:
     """Query game rules."""
+    answer = _RULES.get(" ".join(_RULES_PUNCT_RE.sub("", query).lower().split()))
+    if answer is not None:
+        return {"query": query, "answer": answer}
+    
     args = ["--headless", "--query", query]
-    stdout, stderr, code = run_enoch(args)
+    stdout, stderr, code = await run_enoch(args)
     return {"query": query, "answer": stdout.strip()}
 
 
-def generate_position(position: str, state_file: Optional[str] = None, show_board: bool = False) -> dict:
+@_invalidates_state_cache
+async def generate_position(
+    position: str,
+    state_file: Optional[str] = None,
+    show_board: bool = False,
+    state_bytes: Optional[bytes] = None,
+) -> dict:
     """Generate a custom position."""
     args = ["--headless", "--generate", position]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes, emit=True)
     if show_board:
         args.append("--show")
     
-    stdout, stderr, code = run_enoch(args)
+    stdout, stderr, code = await run_enoch(args, stdin)
+    stdout, new_state = _split_state(stdout)
     
     result = {"success": code == 0}
-    lines = stdout.strip().split("\n")
+    lines = stdout.splitlines()
     
     for line in lines:
         if "Generated position with" in line:
@@ -117,66 +666,76 @@ def generate_position(position: str, state_file: Optional[str] = None, show_boar
         # Extract board (everything after first line)
         board_lines = [l for l in lines if l and not l.startswith("✓")]
         result["board"] = "\n".join(board_lines)
+    if new_state is not None:
+        result["state_bytes"] = new_state
     
     return result
 
 
-def make_move(move: str, state_file: str, show_board: bool = False) -> dict:
+@_invalidates_state_cache
+async def make_move(
+    move: str, state_file: Optional[str] = None, show_board: bool = False, state_bytes: Optional[bytes] = None
+) -> dict:
     """Make a move in a game."""
-    args = ["--headless", "--move", move, "--state", state_file]
+    args = ["--headless", "--move", move]
+    stdin = _add_state(args, state_file, state_bytes, emit=True)
     if show_board:
         args.append("--show")
     
-    stdout, stderr, code = run_enoch(args)
+    stdout, stderr, code = await run_enoch(args, stdin)
+    stdout, new_state = _split_state(stdout)
     
     result = {"success": code == 0}
     if code == 0:
         if show_board:
-            lines = stdout.strip().split("\n")
+            lines = stdout.splitlines()
             board_lines = [l for l in lines if l and not l.startswith("✓") and not l.startswith("🤖")]
             result["board"] = "\n".join(board_lines)
     else:
         result["error"] = stderr.strip() or stdout.strip()
+    if new_state is not None:
+        result["state_bytes"] = new_state
     
     return result
 
 
-def get_status(state_file: Optional[str] = None) -> dict:
+@_state_aware_cache()
+async def get_status(
+    state_file: Optional[str] = None, legacy: bool = False, state_bytes: Optional[bytes] = None
+) -> dict:
     """Get game status."""
     args = ["--headless", "--status"]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes)
+    if not legacy:
+        return await _run_json(args, stdin)
     
-    stdout, stderr, code = run_enoch(args)
-    lines = stdout.strip().split("\n")
+    stdout, stderr, code = await run_enoch(args, stdin)
     
     result = {"current_turn": None, "armies": {}, "winner": None}
     
-    for line in lines:
-        if "Current turn:" in line:
-            result["current_turn"] = line.split("Current turn:")[1].strip()
-        elif ":" in line and any(army in line for army in ["Blue", "Red", "Black", "Yellow"]):
-            parts = line.split(":")
-            army = parts[0].strip()
-            status = parts[1].strip()
-            result["armies"][army] = status
-        elif "Winner:" in line:
-            result["winner"] = line.split("Winner:")[1].strip()
+    for m in _STATUS_RE.finditer(stdout):
+        if m["turn"] is not None:
+            result["current_turn"] = m["turn"]
+        elif m["army"] is not None:
+            result["armies"][m["army"]] = m["status"]
+        else:
+            result["winner"] = m["winner"]
     
     return result
 
 
-def get_legal_moves(army: str, state_file: Optional[str] = None) -> dict:
+@_state_aware_cache()
+async def get_legal_moves(
+    army: str, state_file: Optional[str] = None, legacy: bool = False, state_bytes: Optional[bytes] = None
+) -> dict:
     """Get legal moves for an army."""
     args = ["--headless", "--legal-moves", army]
-    if state_file:
-        args.extend(["--state", state_file])
-    
-    stdout, stderr, code = run_enoch(args)
-    lines = stdout.strip().split("\n")
+    stdin = _add_state(args, state_file, state_bytes)
+    if not legacy:
+        return await _run_json(args, stdin)
     
     moves = []
-    for line in lines[1:]:  # Skip header
+    async for line in _stream_enoch(args, stdin):  # The header line has no arrow
         line = line.strip()
         if "->" in line or "→" in line:
             parts = line.split("→" if "→" in line else "->")
@@ -186,126 +745,139 @@ def get_legal_moves(army: str, state_file: Optional[str] = None) -> dict:
     return {"army": army, "moves": moves}
 
 
-def convert_format(format: str, state_file: Optional[str] = None) -> dict:
+@_state_aware_cache()
+async def convert_format(
+    format: str, state_file: Optional[str] = None, state_bytes: Optional[bytes] = None
+) -> dict:
     """Convert game state to different format."""
     args = ["--headless", "--convert", format]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes)
     
-    stdout, stderr, code = run_enoch(args)
-    return {"format": format, "output": stdout.strip()}
+    return {"format": format, "output": "\n".join([line async for line in _stream_enoch(args, stdin)])}
 
 
-def show_board(state_file: Optional[str] = None) -> dict:
+@_state_aware_cache()
+async def show_board(state_file: Optional[str] = None, state_bytes: Optional[bytes] = None) -> dict:
     """Show the current board."""
     args = ["--headless", "--show"]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes)
     
-    stdout, stderr, code = run_enoch(args)
-    return {"board": stdout.strip()}
+    return {"board": "\n".join([line async for line in _stream_enoch(args, stdin)])}
 
 
-def run_perft(depth: int, state_file: Optional[str] = None) -> dict:
+@_state_aware_cache()
+async def run_perft(
+    depth: int, state_file: Optional[str] = None, legacy: bool = False, state_bytes: Optional[bytes] = None
+) -> dict:
     """Run performance test."""
     args = ["--headless", "--perft", str(depth)]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes)
+    if not legacy:
+        return await _run_json(args, stdin)
     
-    stdout, stderr, code = run_enoch(args)
-    lines = stdout.strip().split("\n")
+    stdout, stderr, code = await run_enoch(args, stdin)
     
     result = {"depth": depth}
-    for line in lines:
-        if "Nodes:" in line:
-            result["nodes"] = int(line.split("Nodes:")[1].strip())
-        elif "Time:" in line:
-            result["time_seconds"] = float(line.split("Time:")[1].strip().rstrip("s"))
-        elif "NPS:" in line:
-            result["nps"] = int(float(line.split("NPS:")[1].strip()))
+    # The totals are always the last lines, however much output precedes them
+    tail = "\n".join(stdout.splitlines()[-5:])
+    for m in _PERFT_RE.finditer(tail):
+        if m["nodes"] is not None:
+            result["nodes"] = int(m["nodes"])
+        elif m["time"] is not None:
+            result["time_seconds"] = float(m["time"])
+        else:
+            result["nps"] = int(float(m["nps"]))
     
     return result
 
 
-def list_arrays() -> dict:
+async def list_arrays(legacy: bool = False) -> dict:
     """List all available starting arrays."""
     args = ["--headless", "--list-arrays"]
-    stdout, stderr, code = run_enoch(args)
-    
-    arrays = []
-    lines = stdout.strip().split("\n")
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        if line and line[0].isdigit() and "." in line:
-            # Parse "1. Array Name"
-            parts = line.split(".", 1)
-            if len(parts) == 2:
-                name = parts[1].strip()
-                # Next line is description
-                if i + 1 < len(lines):
-                    desc = lines[i + 1].strip()
-                    arrays.append({"name": name, "description": desc})
-                    i += 2
-                    continue
-        i += 1
+    if not legacy:
+        return await _run_json(args)
+    
+    stdout, stderr, code = await run_enoch(args)
+    
+    # "1. Array Name" followed by an indented description line
+    arrays = [
+        {"name": m["name"], "description": m["description"]}
+        for m in _ARRAY_RE.finditer(stdout)
+    ]
     
     return {"arrays": arrays}
 
 
-def undo_moves(count: int, state_file: str) -> dict:
+@_invalidates_state_cache
+async def undo_moves(
+    count: int, state_file: Optional[str] = None, state_bytes: Optional[bytes] = None
+) -> dict:
     """Undo last N moves."""
-    args = ["--headless", "--undo", str(count), "--state", state_file]
-    stdout, stderr, code = run_enoch(args)
+    args = ["--headless", "--undo", str(count)]
+    stdin = _add_state(args, state_file, state_bytes, emit=True)
+    stdout, stderr, code = await run_enoch(args, stdin)
+    stdout, new_state = _split_state(stdout)
     
     if code == 0:
-        return {"success": True, "message": stdout.strip()}
+        result = {"success": True, "message": stdout.strip()}
     else:
-        return {"success": False, "error": stdout.strip() or stderr.strip()}
+        result = {"success": False, "error": stdout.strip() or stderr.strip()}
+    if new_state is not None:
+        result["state_bytes"] = new_state
+    
+    return result
 
 
-def run_batch(batch_file: str, state_file: Optional[str] = None) -> dict:
+@_invalidates_state_cache
+async def run_batch(
+    batch_file: str, state_file: Optional[str] = None, state_bytes: Optional[bytes] = None
+) -> dict:
     """Execute commands from batch file."""
     args = ["--headless", "--batch", batch_file]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes, emit=True)
+    
+    stdout, stderr, code = await run_enoch(args, stdin)
+    stdout, new_state = _split_state(stdout)
+    
+    result = {"success": code == 0, "output": stdout.strip()}
+    if new_state is not None:
+        result["state_bytes"] = new_state
     
-    stdout, stderr, code = run_enoch(args)
-    return {"success": code == 0, "output": stdout.strip()}
+    return result
 
 
-def get_stats(state_file: Optional[str] = None) -> dict:
+@_state_aware_cache()
+async def get_stats(
+    state_file: Optional[str] = None, legacy: bool = False, state_bytes: Optional[bytes] = None
+) -> dict:
     """Get game statistics."""
     args = ["--headless", "--stats"]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes)
+    if not legacy:
+        return await _run_json(args, stdin)
     
-    stdout, stderr, code = run_enoch(args)
-    lines = stdout.strip().split("\n")
+    stdout, stderr, code = await run_enoch(args, stdin)
     
     result = {"moves_played": 0, "captures": {}, "status": {}}
     
-    for line in lines:
-        if "Moves played:" in line:
-            result["moves_played"] = int(line.split("Moves played:")[1].strip())
-        elif "lost:" in line and any(army in line for army in ["Blue", "Red", "Black", "Yellow"]):
-            parts = line.split(":")
-            army = parts[0].strip()
-            lost_info = parts[1].strip()
-            result["captures"][army] = lost_info
-        elif ":" in line and any(status in line for status in ["Active", "Frozen", "In Check"]):
-            parts = line.split(":")
-            army = parts[0].strip()
-            status = parts[1].strip()
-            result["status"][army] = status
+    for m in _STATS_RE.finditer(stdout):
+        if m["moves"] is not None:
+            result["moves_played"] = int(m["moves"])
+        elif m["lost_army"] is not None:
+            result["captures"][m["lost_army"]] = m["lost"]
+        else:
+            result["status"][m["army"]] = m["status"]
     
     return result
 
 
-def export_pgn(state_file: str, output_file: str) -> dict:
+async def export_pgn(
+    state_file: Optional[str], output_file: str, state_bytes: Optional[bytes] = None
+) -> dict:
     """Export game to PGN format."""
-    args = ["--headless", "--state", state_file, "--export-pgn", output_file]
-    stdout, stderr, code = run_enoch(args)
+    args = ["--headless", "--export-pgn", output_file]
+    stdin = _add_state(args, state_file, state_bytes)
+    stdout, stderr, code = await run_enoch(args, stdin)
     
     if code == 0:
         return {"success": True, "output_file": output_file}
@@ -313,18 +885,77 @@ def export_pgn(state_file: str, output_file: str) -> dict:
         return {"success": False, "error": stderr.strip() or stdout.strip()}
 
 
-def import_pgn(pgn_file: str, state_file: Optional[str] = None) -> dict:
+@_invalidates_state_cache
+async def import_pgn(
+    pgn_file: str, state_file: Optional[str] = None, state_bytes: Optional[bytes] = None
+) -> dict:
     """Import game from PGN format."""
     args = ["--headless", "--import-pgn", pgn_file]
-    if state_file:
-        args.extend(["--state", state_file])
+    stdin = _add_state(args, state_file, state_bytes, emit=True)
     
-    stdout, stderr, code = run_enoch(args)
+    stdout, stderr, code = await run_enoch(args, stdin)
+    stdout, new_state = _split_state(stdout)
     
     result = {"success": code == 0}
-    for line in stdout.strip().split("\n"):
+    for line in stdout.splitlines():
         if "Imported" in line and "moves" in line:
             result["message"] = line
+            break
+    if new_state is not None:
+        result["state_bytes"] = new_state
     
     return result
 
+
+class ToolCall(NamedTuple):
+    """One cli wrapper call for batch_tools, e.g. ToolCall("get_status", {"state_file": "game.json"})."""
+
+    name: str
+    arguments: dict
+
+
+_TOOLS = {
+    func.__name__: func
+    for func in (
+        validate_move, analyze_square, query_rules, generate_position, make_move,
+        get_status, get_legal_moves, convert_format, show_board, run_perft,
+        list_arrays, undo_moves, run_batch, get_stats, export_pgn, import_pgn,
+    )
+}
+
+
+async def batch_tools(calls: list[ToolCall]) -> list[dict]:
+    """Run several cli wrappers, in order, through a single enoch process."""
+    unknown = [call.name for call in calls if call.name not in _TOOLS]
+    if unknown:
+        raise ValueError(f"Unknown tool: {unknown[0]}")
+    return await gather_batched(*(_TOOLS[call.name](**call.arguments) for call in calls))
+
+
+def _blocking(func):
+    """Wrap an async cli function for callers without a running event loop."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(func(*args, **kwargs))
+    return wrapper
+
+
+# Synchronous variants for non-MCP users
+run_enoch_sync = _blocking(run_enoch)
+validate_move_sync = _blocking(validate_move)
+analyze_square_sync = _blocking(analyze_square)
+query_rules_sync = _blocking(query_rules)
+generate_position_sync = _blocking(generate_position)
+make_move_sync = _blocking(make_move)
+get_status_sync = _blocking(get_status)
+get_legal_moves_sync = _blocking(get_legal_moves)
+convert_format_sync = _blocking(convert_format)
+show_board_sync = _blocking(show_board)
+run_perft_sync = _blocking(run_perft)
+list_arrays_sync = _blocking(list_arrays)
+undo_moves_sync = _blocking(undo_moves)
+run_batch_sync = _blocking(run_batch)
+get_stats_sync = _blocking(get_stats)
+export_pgn_sync = _blocking(export_pgn)
+import_pgn_sync = _blocking(import_pgn)
+batch_tools_sync = _blocking(batch_tools)
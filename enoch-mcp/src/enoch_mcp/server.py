@@ -1,6 +1,10 @@
 """MCP server for Enochian Chess engine."""
 
 import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable
+
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -10,6 +14,26 @@ from . import cli
 
 server = Server("enoch-mcp")
 
+# Game states for the "session" tool argument, kept in memory between calls.
+# Calls on one session hold its lock from reading the state to storing the new one.
+_SESSIONS: dict[str, bytes] = {}
+_SESSION_LOCKS: dict[str, asyncio.Lock] = {}
+_SESSION_DESCRIPTION = "Optional game id; keeps the game in server memory instead of a state file"
+
+# Tool results are compact by default; ENOCH_MCP_PRETTY=1 indents them for debugging
+if os.environ.get("ENOCH_MCP_PRETTY"):
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+else:
+    try:
+        import orjson
+
+        def _dumps(obj: Any) -> str:
+            return orjson.dumps(obj).decode()
+    except ImportError:
+        def _dumps(obj: Any) -> str:
+            return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
@@ -23,6 +47,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "move": {"type": "string", "description": "Move in format 'army: from-to' (e.g., 'blue: e2-e3')"},
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
                 "required": ["move"],
             },
@@ -35,6 +60,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "square": {"type": "string", "description": "Square to analyze (e.g., 'e2')"},
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
                 "required": ["square"],
             },
@@ -58,6 +84,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "position": {"type": "string", "description": "Position notation (e.g., 'Ke1:blue Ke8:red')"},
                     "state_file": {"type": "string", "description": "Optional path to save position"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                     "show_board": {"type": "boolean", "description": "Return ASCII board representation"},
                 },
                 "required": ["position"],
@@ -71,9 +98,10 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "move": {"type": "string", "description": "Move to make (e.g., 'blue: e2-e3')"},
                     "state_file": {"type": "string", "description": "Path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                     "show_board": {"type": "boolean", "description": "Return board after move"},
                 },
-                "required": ["move", "state_file"],
+                "required": ["move"],
             },
         ),
         Tool(
@@ -83,6 +111,7 @@ async def list_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
             },
         ),
@@ -94,6 +123,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "army": {"type": "string", "description": "Army name (blue/red/black/yellow)"},
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
                 "required": ["army"],
             },
@@ -106,6 +136,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "format": {"type": "string", "description": "Target format (json/ascii/compact)"},
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
                 "required": ["format"],
             },
@@ -117,6 +148,7 @@ async def list_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
             },
         ),
@@ -128,6 +160,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "depth": {"type": "integer", "description": "Search depth (1-6 recommended)"},
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
                 "required": ["depth"],
             },
@@ -148,8 +181,8 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "count": {"type": "integer", "description": "Number of moves to undo (default 1)"},
                     "state_file": {"type": "string", "description": "Path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
-                "required": ["state_file"],
             },
         ),
         Tool(
@@ -160,6 +193,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "batch_file": {"type": "string", "description": "Path to batch command file"},
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
                 "required": ["batch_file"],
             },
@@ -171,6 +205,7 @@ async def list_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "state_file": {"type": "string", "description": "Optional path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
             },
         ),
@@ -181,9 +216,10 @@ async def list_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "state_file": {"type": "string", "description": "Path to game state JSON file"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                     "output_file": {"type": "string", "description": "Path to output PGN file"},
                 },
-                "required": ["state_file", "output_file"],
+                "required": ["output_file"],
             },
         ),
         Tool(
@@ -194,66 +230,130 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "pgn_file": {"type": "string", "description": "Path to PGN file to import"},
                     "state_file": {"type": "string", "description": "Optional path to save game state"},
+                    "session": {"type": "string", "description": _SESSION_DESCRIPTION},
                 },
                 "required": ["pgn_file"],
             },
         ),
+        Tool(
+            name="enoch_end_session",
+            description="Discard a game kept in server memory by the session argument",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "session": {"type": "string", "description": "Game id to discard"},
+                },
+                "required": ["session"],
+            },
+        ),
+        Tool(
+            name="enoch_batch_tool",
+            description="Run one tool for several argument sets through a single enoch process, in order",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tool": {"type": "string", "description": "Tool to run (e.g., 'enoch_validate_move')"},
+                    "calls": {
+                        "type": "array",
+                        "items": {"type": "object"},
+                        "description": "Argument objects, one per call",
+                    },
+                },
+                "required": ["tool", "calls"],
+            },
+        ),
     ]
 
 
+def _state(a: dict) -> dict:
+    """State keyword arguments for a tool call; a session's game wins over state_file."""
+    session = a.get("session")
+    state_bytes = None if session is None else _SESSIONS.get(session, b"")
+    return {"state_file": a.get("state_file"), "state_bytes": state_bytes}
+
+
+_HANDLERS: dict[str, Callable[[dict], Awaitable[Any]]] = {
+    "enoch_validate_move": lambda a: cli.validate_move(a["move"], **_state(a)),
+    "enoch_analyze_square": lambda a: cli.analyze_square(a["square"], **_state(a)),
+    "enoch_query_rules": lambda a: cli.query_rules(a["query"]),
+    "enoch_generate_position": lambda a: cli.generate_position(
+        a["position"], show_board=a.get("show_board", False), **_state(a)
+    ),
+    "enoch_make_move": lambda a: cli.make_move(a["move"], show_board=a.get("show_board", False), **_state(a)),
+    "enoch_get_status": lambda a: cli.get_status(**_state(a)),
+    "enoch_get_legal_moves": lambda a: cli.get_legal_moves(a["army"], **_state(a)),
+    "enoch_convert_format": lambda a: cli.convert_format(a["format"], **_state(a)),
+    "enoch_show_board": lambda a: cli.show_board(**_state(a)),
+    "enoch_perft": lambda a: cli.run_perft(a["depth"], **_state(a)),
+    "enoch_list_arrays": lambda a: cli.list_arrays(),
+    "enoch_undo": lambda a: cli.undo_moves(a.get("count", 1), **_state(a)),
+    "enoch_batch": lambda a: cli.run_batch(a["batch_file"], **_state(a)),
+    "enoch_stats": lambda a: cli.get_stats(**_state(a)),
+    "enoch_export_pgn": lambda a: cli.export_pgn(output_file=a["output_file"], **_state(a)),
+    "enoch_import_pgn": lambda a: cli.import_pgn(a["pgn_file"], **_state(a)),
+    "enoch_batch_tool": lambda a: batch_tool(a["tool"], a["calls"]),
+    "enoch_end_session": lambda a: end_session(a["session"]),
+}
+
+
+async def _dispatch(name: str, arguments: dict) -> Any:
+    """Run a single tool and return its result."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    session = arguments.get("session")
+    if session is None:
+        result = await handler(arguments)
+        if isinstance(result, dict):
+            # Never hand raw state to the client
+            result.pop("state_bytes", None)
+        return result
+
+    while True:
+        lock = _SESSION_LOCKS.setdefault(session, asyncio.Lock())
+        async with lock:
+            if _SESSION_LOCKS.get(session) is not lock:
+                # end_session retired this lock while we waited; queue on the new game's lock
+                continue
+            result = await handler(arguments)
+            if isinstance(result, dict) and "state_bytes" in result:
+                _SESSIONS[session] = result.pop("state_bytes")
+            return result
+
+
+async def end_session(session: str) -> dict:
+    """Forget a session's in-memory game; runs under the session's lock, which it retires."""
+    ended = _SESSIONS.pop(session, None) is not None
+    _SESSION_LOCKS.pop(session, None)
+    return {"session": session, "ended": ended}
+
+
+async def batch_tool(name: str, args_list: list[dict]) -> list[dict]:
+    """Run one tool for each argument set through a single enoch process."""
+    if name == "enoch_batch_tool":
+        raise ValueError("enoch_batch_tool cannot batch itself")
+
+    async def run_one(arguments: dict) -> dict:
+        try:
+            return await _dispatch(name, arguments)
+        except Exception as e:
+            return {"error": str(e)}
+
+    if any("session" in arguments for arguments in args_list):
+        # Each call has to see the session state left by the one before it
+        return [await run_one(arguments) for arguments in args_list]
+    return await cli.gather_batched(*(run_one(arguments) for arguments in args_list))
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls."""
-    import json
-    
     try:
-        if name == "enoch_validate_move":
-            result = cli.validate_move(arguments["move"], arguments.get("state_file"))
-        elif name == "enoch_analyze_square":
-            result = cli.analyze_square(arguments["square"], arguments.get("state_file"))
-        elif name == "enoch_query_rules":
-            result = cli.query_rules(arguments["query"])
-        elif name == "enoch_generate_position":
-            result = cli.generate_position(
-                arguments["position"],
-                arguments.get("state_file"),
-                arguments.get("show_board", False)
-            )
-        elif name == "enoch_make_move":
-            result = cli.make_move(
-                arguments["move"],
-                arguments["state_file"],
-                arguments.get("show_board", False)
-            )
-        elif name == "enoch_get_status":
-            result = cli.get_status(arguments.get("state_file"))
-        elif name == "enoch_get_legal_moves":
-            result = cli.get_legal_moves(arguments["army"], arguments.get("state_file"))
-        elif name == "enoch_convert_format":
-            result = cli.convert_format(arguments["format"], arguments.get("state_file"))
-        elif name == "enoch_show_board":
-            result = cli.show_board(arguments.get("state_file"))
-        elif name == "enoch_perft":
-            result = cli.run_perft(arguments["depth"], arguments.get("state_file"))
-        elif name == "enoch_list_arrays":
-            result = cli.list_arrays()
-        elif name == "enoch_undo":
-            result = cli.undo_moves(arguments.get("count", 1), arguments["state_file"])
-        elif name == "enoch_batch":
-            result = cli.run_batch(arguments["batch_file"], arguments.get("state_file"))
-        elif name == "enoch_stats":
-            result = cli.get_stats(arguments.get("state_file"))
-        elif name == "enoch_export_pgn":
-            result = cli.export_pgn(arguments["state_file"], arguments["output_file"])
-        elif name == "enoch_import_pgn":
-            result = cli.import_pgn(arguments["pgn_file"], arguments.get("state_file"))
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        result = await _dispatch(name, arguments)
+        return [TextContent(type="text", text=_dumps(result))]
     
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": str(e)}))]
 
 
 async def run_server():
@@ -0,0 +1,75 @@
+import asyncio
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from enoch_mcp import cli
+
+STUB = Path(__file__).with_name("stub_enoch.py")
+
+# Generous, but turns a scheduling deadlock into a failure instead of a hang
+TIMEOUT = 10
+
+
+def make_stub_binary(directory: Path, name: str = "enoch") -> Path:
+    """Write an executable that runs stub_enoch.py with this interpreter."""
+    binary = directory / name
+    binary.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{STUB}" "$@"\n')
+    binary.chmod(binary.stat().st_mode | stat.S_IXUSR)
+    return binary
+
+
+def reset_cli() -> None:
+    cli._resolve_enoch_binary.cache_clear()
+    cli.clear_state_cache()
+    if cli._pool is not None:
+        cli._pool.close()
+    cli._pool = None
+
+
+class StubLog:
+    """Read the process and command log written by the stub binary."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def entries(self, kind: str) -> list[str]:
+        if not self.path.exists():
+            return []
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        return [line.split(" ", 1)[1] for line in lines if line.startswith(kind + " ")]
+
+    def commands(self) -> list[str]:
+        return self.entries("cmd")
+
+    def serve_pids(self) -> list[int]:
+        return [int(pid) for pid in self.entries("serve")]
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    log = tmp_path / "stub.log"
+    monkeypatch.setenv("ENOCH_BINARY", str(make_stub_binary(tmp_path)))
+    monkeypatch.setenv("STUB_LOG", str(log))
+    reset_cli()
+    yield StubLog(log)
+    reset_cli()
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "game.json")
+
+
+@pytest.fixture
+def make_binary(tmp_path):
+    """Create further stub binaries, e.g. to make the cli switch binaries."""
+    return lambda name: make_stub_binary(tmp_path, name)
+
+
+@pytest.fixture
+def run():
+    """asyncio.run with a timeout."""
+    return lambda coro: asyncio.run(asyncio.wait_for(coro, TIMEOUT))
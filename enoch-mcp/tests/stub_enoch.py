@@ -0,0 +1,102 @@
+"""Stand-in for the enoch binary, speaking the same `--headless --serve` framing.
+
+The game state is a JSON file holding the list of moves made so far. Every
+process start and every command is appended to $STUB_LOG so tests can see
+how many processes ran and which commands actually reached the binary.
+"""
+
+import json
+import os
+import sys
+import time
+
+BANNER = "ENOCH-SERVE 1"
+SENTINEL = "---END---"
+STATE_MARKER = "---STATE---"
+
+
+def log(entry: str) -> None:
+    with open(os.environ["STUB_LOG"], "a", encoding="utf-8") as f:
+        f.write(entry + "\n")
+
+
+def option(argv: list[str], name: str):
+    return argv[argv.index(name) + 1] if name in argv else None
+
+
+def load_moves(state_file) -> list:
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            return json.load(f)["moves"]
+    except (TypeError, OSError):
+        return []
+
+
+def run(argv: list[str], read_state) -> int:
+    """Run one command; exits the process where the real enoch would.
+
+    read_state returns the `--state -` game: one line under --serve, else all of stdin.
+    """
+    log("cmd " + " ".join(argv))
+    state_file = option(argv, "--state")
+    if state_file == "-":
+        text = read_state().strip()
+        moves = json.loads(text)["moves"] if text else []
+    else:
+        moves = load_moves(state_file)
+
+    if "--move" in argv:
+        move = option(argv, "--move")
+        if move.startswith("bad"):
+            print(f"Error: illegal move {move}", file=sys.stderr)
+            sys.stdout.flush()
+            sys.exit(1)
+        if move.startswith("slow"):
+            time.sleep(float(os.environ.get("STUB_SLOW_MOVE_SECONDS", "0")))
+        moves.append(move)
+        if state_file != "-":
+            with open(state_file, "w", encoding="utf-8") as f:
+                json.dump({"moves": moves}, f)
+        print(f"✓ {move}")
+        if "--emit-state" in argv:
+            print(STATE_MARKER)
+            print(json.dumps({"moves": moves}))
+    elif "--status" in argv:
+        print(json.dumps({"current_turn": len(moves), "armies": {}, "winner": None, "moves": moves}))
+    elif "--perft" in argv:
+        time.sleep(float(os.environ.get("STUB_PERFT_SECONDS", "0")))
+        print(json.dumps({"depth": int(option(argv, "--perft")), "nodes": 1, "time_seconds": 0.0, "nps": 1}))
+    elif "--show" in argv:
+        for rank in range(8, 0, -1):
+            print(f"{rank} . . . . . . . .")
+    else:
+        print("error: unsupported", file=sys.stderr)
+        return 2
+    return 0
+
+
+def serve() -> None:
+    print(BANNER, flush=True)
+    while line := sys.stdin.readline():
+        line = line.rstrip("\n")
+        if not line:
+            continue
+        code = run(line.split("\t"), sys.stdin.readline)
+        print(f"{SENTINEL}\tcode={code}")
+        print(SENTINEL, file=sys.stderr)
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if "--serve" in argv:
+        log(f"serve {os.getpid()}")
+        serve()
+    else:
+        log(f"spawn {os.getpid()}")
+        sys.exit(run(argv, sys.stdin.read))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import asyncio
+
+from enoch_mcp import cli
+
+
+def test_batch_runs_commands_in_order_through_one_process(stub, state_file, run):
+    async def main():
+        return await cli.gather_batched(
+            cli.make_move("a", state_file),
+            cli.get_status(state_file),
+            cli.make_move("b", state_file),
+            cli.get_status(state_file),
+        )
+
+    moved_a, status_a, moved_b, status_b = run(main())
+
+    assert moved_a["success"] and moved_b["success"]
+    assert status_a["moves"] == ["a"]
+    assert status_b["moves"] == ["a", "b"]
+    assert len(stub.serve_pids()) == 1
+    assert stub.entries("spawn") == []
+
+
+def test_batch_continues_in_a_new_process_after_a_command_exits(stub, state_file, run):
+    async def main():
+        return await cli.gather_batched(
+            cli.make_move("a", state_file),
+            cli.make_move("bad", state_file),
+            cli.get_status(state_file),
+            cli.make_move("c", state_file),
+            cli.get_status(state_file),
+        )
+
+    moved_a, moved_bad, status_a, moved_c, status_c = run(main())
+
+    assert moved_a["success"] and moved_c["success"]
+    assert moved_bad == {"success": False, "error": "Error: illegal move bad"}
+    assert status_a["moves"] == ["a"]
+    assert status_c["moves"] == ["a", "c"]
+    assert len(stub.serve_pids()) == 2
+
+
+def test_batch_waits_for_every_task_before_flushing(stub, state_file, run):
+    async def move_then_status():
+        await cli.make_move("a", state_file)
+        return await cli.get_status(state_file)
+
+    async def late_move():
+        await asyncio.sleep(0.05)
+        return await cli.make_move("late", state_file)
+
+    async def main():
+        # query_rules answers from the bundled table and never reaches enoch
+        return await cli.gather_batched(
+            move_then_status(), late_move(), cli.query_rules(next(iter(cli._RULES)))
+        )
+
+    status, late, rules = run(main())
+
+    assert late["success"]
+    assert rules["answer"] == next(iter(cli._RULES.values()))
+    # The first flush held back until late_move parked, so both moves ran
+    # together and the status query came in a second flush
+    assert status["moves"] == ["a", "late"]
+    assert len(stub.serve_pids()) == 2
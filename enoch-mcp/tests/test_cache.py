@@ -0,0 +1,54 @@
+import json
+
+from enoch_mcp import cli
+
+
+def status_queries(stub) -> int:
+    return sum("--status" in command for command in stub.commands())
+
+
+def test_status_is_cached_until_a_move(stub, state_file, run):
+    async def main():
+        await cli.make_move("a", state_file)
+        first = await cli.get_status(state_file)
+        second = await cli.get_status(state_file)
+        await cli.make_move("b", state_file)
+        third = await cli.get_status(state_file)
+        return first, second, third
+
+    first, second, third = run(main())
+
+    assert second is first
+    assert first["moves"] == ["a"]
+    assert third["moves"] == ["a", "b"]
+    assert status_queries(stub) == 2
+
+
+def test_cache_notices_state_file_changes_made_elsewhere(stub, state_file, run):
+    async def main():
+        await cli.make_move("a", state_file)
+        first = await cli.get_status(state_file)
+        with open(state_file, "w", encoding="utf-8") as f:
+            json.dump({"moves": ["a", "outside"]}, f)
+        return first, await cli.get_status(state_file)
+
+    first, second = run(main())
+
+    assert first["moves"] == ["a"]
+    assert second["moves"] == ["a", "outside"]
+    assert status_queries(stub) == 2
+
+
+def test_state_bytes_key_the_cache(stub, run):
+    async def main():
+        return [
+            await cli.run_perft(1, state_bytes=b""),
+            await cli.run_perft(1, state_bytes=b""),
+            await cli.run_perft(1, state_bytes=b'{"moves": []}'),
+        ]
+
+    first, second, third = run(main())
+
+    assert second is first
+    assert third == first and third is not first
+    assert sum("--perft" in command for command in stub.commands()) == 2
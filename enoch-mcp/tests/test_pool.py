@@ -0,0 +1,104 @@
+import asyncio
+import json
+import os
+import time
+
+from enoch_mcp import cli
+
+
+def process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def wait_for(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_sequential_calls_share_one_session(stub):
+    for _ in range(3):
+        assert cli.run_enoch_sync(["--headless", "--status"])[2] == 0
+
+    assert len(stub.serve_pids()) == 1
+    assert len(stub.commands()) == 3
+
+
+def test_dead_session_is_restarted(stub):
+    cli.run_enoch_sync(["--headless", "--status"])
+    session = cli._pool.idle.get_nowait()
+    session.proc.kill()
+    session.proc.wait()
+    cli._pool.idle.put(session)
+
+    stdout, _, code = cli.run_enoch_sync(["--headless", "--status"])
+
+    assert code == 0 and "current_turn" in stdout
+    assert len(stub.serve_pids()) == 2
+
+
+def test_pool_grows_to_its_size_under_concurrent_load(stub, monkeypatch, run):
+    monkeypatch.setenv("STUB_PERFT_SECONDS", "0.2")
+    cli._pool = cli._EnochPool(cli.find_enoch_binary(), 2)
+
+    async def main():
+        return await asyncio.gather(*(cli.run_enoch(["--headless", "--perft", "1"]) for _ in range(4)))
+
+    results = run(main())
+
+    assert [code for _, _, code in results] == [0, 0, 0, 0]
+    assert len(stub.serve_pids()) == 2
+
+
+def test_replacing_the_pool_stops_its_busy_sessions(stub, monkeypatch, make_binary, run):
+    monkeypatch.setenv("STUB_PERFT_SECONDS", "0.5")
+    old_pool = cli._pool = cli._EnochPool(cli.find_enoch_binary(), 2)
+
+    async def main():
+        calls = [asyncio.ensure_future(cli.run_enoch(["--headless", "--perft", "1"])) for _ in range(2)]
+        await asyncio.to_thread(wait_for, lambda: len(stub.commands()) == 2)
+
+        # Switch binaries while both sessions are busy
+        monkeypatch.setenv("ENOCH_BINARY", str(make_binary("enoch-new")))
+        cli._resolve_enoch_binary.cache_clear()
+        cli._get_pool(cli.find_enoch_binary())
+        return await asyncio.gather(*calls)
+
+    results = run(main())
+
+    assert [code for _, _, code in results] == [0, 0]
+    assert old_pool.closed and old_pool.idle.empty()
+    assert cli._pool is not old_pool
+    assert not any(process_exists(pid) for pid in stub.serve_pids())
+
+
+def test_streamed_output_is_not_kept_by_the_session(stub):
+    lines = []
+    stdout, _, code = cli._get_pool(cli.find_enoch_binary()).call(["--headless", "--show"], lines.append)
+
+    assert code == 0
+    assert stdout == ""
+    assert [line.split()[0] for line in lines] == [str(rank) for rank in range(8, 0, -1)]
+    assert cli.show_board_sync()["board"] == "".join(lines).rstrip("\n")
+
+
+def test_state_file_named_dash_is_a_file_not_stdin(stub, tmp_path, monkeypatch, run):
+    monkeypatch.chdir(tmp_path)
+    args = []
+    # Checked first: with `--state -` the session would wait forever for the state line
+    assert cli._add_state(args, "-", None) is None and args == ["--state", "./-"]
+
+    async def main():
+        moved = await cli.make_move("a", "-")
+        return moved, await cli.get_status("-")
+
+    moved, status = run(main())
+
+    assert moved["success"] and status["moves"] == ["a"]
+    assert json.loads((tmp_path / "-").read_text(encoding="utf-8")) == {"moves": ["a"]}
+    assert all("--state ./-" in command for command in stub.commands())
@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from enoch_mcp import server  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def sessions():
+    server._SESSIONS.clear()
+    server._SESSION_LOCKS.clear()
+    yield
+    server._SESSIONS.clear()
+    server._SESSION_LOCKS.clear()
+
+
+def session_moves(session: str) -> list[str]:
+    return json.loads(server._SESSIONS[session])["moves"]
+
+
+def test_concurrent_moves_on_a_session_are_all_kept(stub, run):
+    async def scenario():
+        await asyncio.gather(
+            *(server._dispatch("enoch_make_move", {"move": f"m{i}", "session": "g"}) for i in range(5))
+        )
+
+    run(scenario())
+    assert sorted(session_moves("g")) == [f"m{i}" for i in range(5)]
+
+
+def test_end_session_while_calls_wait_loses_no_move(stub, run, monkeypatch):
+    monkeypatch.setenv("STUB_SLOW_MOVE_SECONDS", "0.5")
+
+    async def scenario():
+        slow = asyncio.create_task(server._dispatch("enoch_make_move", {"move": "slow", "session": "g"}))
+        await asyncio.sleep(0.1)
+        # Both queue behind the slow move; the move must then run on the fresh game
+        end = asyncio.create_task(server._dispatch("enoch_end_session", {"session": "g"}))
+        queued = asyncio.create_task(server._dispatch("enoch_make_move", {"move": "queued", "session": "g"}))
+        ended = await end
+        later = await server._dispatch("enoch_make_move", {"move": "later", "session": "g"})
+        return await slow, ended, await queued, later
+
+    slow, ended, queued, later = run(scenario())
+    assert slow["success"] and queued["success"] and later["success"]
+    assert ended == {"session": "g", "ended": True}
+    assert sorted(session_moves("g")) == ["later", "queued"]
@@ -49,20 +49,26 @@ use std::{env, io, process};
     # Run batch commands
     enoch --headless --batch commands.txt --state game.json
 
+    # Serve tab-separated commands over stdin (used by enoch-mcp)
+    enoch --headless --serve
+
+    # Read the game state from stdin and print the new state after the move
+    enoch --headless --move \"blue: e2-e3\" --state - --emit-state < game.json
+
 For more information, see README.md or visit https://github.com/monistowl/enoch")]
 struct Args {
     /// Run in headless mode (no TUI)
     #[arg(long)]
     headless: bool,
     
-    /// Game state file
+    /// Game state file ("-" reads the JSON state from stdin)
     #[arg(long, value_name = "FILE")]
     state: Option<String>,
     
     // === Move Operations ===
     
     /// Make a move (format: "army: from-to")
-    #[arg(long, value_name = "MOVE")]
+    #[arg(long = "move", alias = "move-cmd", value_name = "MOVE")]
     move_cmd: Option<String>,
     
     /// Validate a move without applying it
@@ -133,6 +139,10 @@ struct Args {
     #[arg(long, value_name = "FILE")]
     batch: Option<String>,
     
+    /// Serve headless commands from stdin (one tab-separated argument list per line)
+    #[arg(long)]
+    serve: bool,
+    
     // === AI & Automation ===
     
     /// Enable AI for armies (comma-separated)
@@ -164,6 +174,55 @@ struct Args {
     /// Suppress non-essential output
     #[arg(long, short)]
     quiet: bool,
+    
+    /// Print JSON instead of text (status, validate, analyze, perft, stats, legal-moves, list-arrays)
+    #[arg(long)]
+    json: bool,
+    
+    /// Print the resulting game state as one line of JSON after the output
+    #[arg(long)]
+    emit_state: bool,
+}
+
+impl Args {
+    /// State file on disk; `--state -` passes the state over stdin instead
+    fn state_file(&self) -> Option<&str> {
+        self.state.as_deref().filter(|state| *state != "-")
+    }
+    
+    fn state_from_stdin(&self) -> bool {
+        self.state.as_deref() == Some("-")
+    }
+}
+
+/// Line printed by `--emit-state` before the game state
+const STATE_MARKER: &str = "---STATE---";
+
+/// Set while `--serve` owns stdin, where each state is a single line
+static SERVING: std::sync::atomic::AtomicBool = std::sync::atomic::AtomicBool::new(false);
+
+/// Read the `--state -` input: all of stdin, or one line under `--serve`.
+/// Empty input starts a new game.
+fn read_stdin_state() -> Option<String> {
+    use std::io::{BufRead, Read};
+    
+    let mut state = String::new();
+    if SERVING.load(std::sync::atomic::Ordering::Relaxed) {
+        io::stdin().lock().read_line(&mut state).ok()?;
+    } else {
+        io::stdin().read_to_string(&mut state).ok()?;
+    }
+    let state = state.trim();
+    (!state.is_empty()).then(|| state.to_string())
+}
+
+fn emit_state(game: &Game, args: &Args) {
+    if args.emit_state {
+        if let Ok(json) = serde_json::to_string(game) {
+            println!("{}", STATE_MARKER);
+            println!("{}", json);
+        }
+    }
 }
 
 pub const MIN_WIDTH: u16 = 80;
@@ -325,9 +384,19 @@ fn run_headless(args: Args) {
     use crate::engine::ai;
     use std::fs;
     
+    // Serve mode runs every stdin line as its own headless invocation
+    if args.serve {
+        run_serve();
+        return;
+    }
+    
+    // Always consume the stdin state line, even for commands that ignore it,
+    // so --serve stays in step with the next command
+    let stdin_state = if args.state_from_stdin() { read_stdin_state() } else { None };
+    
     // Handle list-arrays command first (doesn't need game state)
     if args.list_arrays {
-        list_arrays();
+        list_arrays(args.json);
         return;
     }
     
@@ -337,34 +406,23 @@ fn run_headless(args: Args) {
         return;
     }
     
-    // Load or create game
-    let mut game = if let Some(state_file) = &args.state {
-        if let Ok(json) = fs::read_to_string(state_file) {
-            Game::from_json(&json).unwrap_or_else(|_| {
-                let array = if let Some(array_name) = &args.array {
-                    find_array_by_name(array_name).unwrap_or_else(|| {
-                        eprintln!("❌ Unknown array: {}", array_name);
-                        eprintln!("Use --list-arrays to see available options");
-                        process::exit(1);
-                    })
-                } else {
-                    default_array()
-                };
-                Game::from_array_spec(array)
-            })
-        } else {
-            let array = if let Some(array_name) = &args.array {
-                find_array_by_name(array_name).unwrap_or_else(|| {
-                    eprintln!("❌ Unknown array: {}", array_name);
-                    eprintln!("Use --list-arrays to see available options");
-                    process::exit(1);
-                })
-            } else {
-                default_array()
-            };
-            Game::from_array_spec(array)
-        }
-    } else {
+    // Only write the state file back when it is new or the game changed, so
+    // read-only queries leave it (and its mtime) untouched
+    let mut state_changed = args.state_file()
+        .map_or(false, |state_file| !std::path::Path::new(state_file).exists());
+    
+    // Load or create game; state passed on stdin must parse, since falling
+    // back to a new game would silently lose it
+    let stored = match stdin_state {
+        Some(json) => Some(Game::from_json(&json).unwrap_or_else(|e| {
+            eprintln!("Error: invalid game state on stdin: {}", e);
+            process::exit(1);
+        })),
+        None => args.state_file()
+            .and_then(|state_file| fs::read_to_string(state_file).ok())
+            .and_then(|json| Game::from_json(&json).ok()),
+    };
+    let mut game = stored.unwrap_or_else(|| {
         let array = if let Some(array_name) = &args.array {
             find_array_by_name(array_name).unwrap_or_else(|| {
                 eprintln!("❌ Unknown array: {}", array_name);
@@ -375,13 +433,13 @@ fn run_headless(args: Args) {
             default_array()
         };
         Game::from_array_spec(array)
-    };
+    });
     
     // Import PGN if provided
     if let Some(pgn_file) = &args.import_pgn {
         game = import_pgn(pgn_file);
         // Save to state file if provided
-        if let Some(save_file) = &args.state {
+        if let Some(save_file) = args.state_file() {
             if let Ok(json) = game.to_json() {
                 fs::write(save_file, json).ok();
                 println!("Imported and saved to {}", save_file);
@@ -412,13 +470,17 @@ fn run_headless(args: Args) {
     
     // Validate move if provided
     if let Some(validate_cmd) = &args.validate {
-        validate_move(&mut game, validate_cmd);
+        validate_move(&mut game, validate_cmd, args.json);
         return;
     }
     
     // Analyze square if provided
     if let Some(square_str) = &args.analyze {
-        analyze_square(&mut game, square_str);
+        if args.json {
+            analyze_square_json(&mut game, square_str);
+        } else {
+            analyze_square(&mut game, square_str);
+        }
         return;
     }
     
@@ -430,7 +492,7 @@ fn run_headless(args: Args) {
     
     // Perft if provided
     if let Some(depth) = args.perft {
-        run_perft(&mut game, depth);
+        run_perft(&mut game, depth, args.json);
         return;
     }
     
@@ -449,6 +511,7 @@ fn run_headless(args: Args) {
         
         // AI moves after player move
         make_ai_moves(&mut game, &ai_armies, &args);
+        state_changed = true;
     }
     
     // Undo moves if requested
@@ -459,7 +522,7 @@ fn run_headless(args: Args) {
                     println!("Undid {} move(s)", undone);
                 }
                 // Save state after undo
-                if let Some(save_file) = &args.state {
+                if let Some(save_file) = args.state_file() {
                     if let Ok(json) = game.to_json() {
                         std::fs::write(save_file, json).ok();
                     }
@@ -475,12 +538,23 @@ fn run_headless(args: Args) {
     // Auto-play mode
     if args.auto_play {
         auto_play(&mut game, &ai_armies, &args);
+        state_changed = true;
     }
     
     // Query commands
     if let Some(army_name) = &args.legal_moves {
         if let Some(army) = Army::from_str(army_name) {
-            show_legal_moves(&mut game, army);
+            if args.json {
+                show_legal_moves_json(&mut game, army, army_name);
+            } else {
+                show_legal_moves(&mut game, army);
+            }
+        } else if args.json {
+            println!("{}", serde_json::json!({
+                "army": army_name,
+                "moves": [],
+                "error": format!("Unknown army '{}'. {}", army_name, Army::suggest_army(army_name)),
+            }));
         }
     }
     
@@ -493,7 +567,11 @@ fn run_headless(args: Args) {
     }
     
     if args.stats {
-        show_stats(&game);
+        if args.json {
+            show_stats_json(&game);
+        } else {
+            show_stats(&game);
+        }
     }
     
     if let Some(output_file) = &args.export_pgn {
@@ -501,7 +579,11 @@ fn run_headless(args: Args) {
     }
     
     if args.status {
-        show_status(&game);
+        if args.json {
+            show_status_json(&game);
+        } else {
+            show_status(&game);
+        }
     }
     
     // Show board
@@ -510,11 +592,12 @@ fn run_headless(args: Args) {
     }
     
     // Save state
-    if let Some(save_file) = &args.state {
+    if let Some(save_file) = args.state_file().filter(|_| state_changed) {
         if let Ok(json) = game.to_json() {
             fs::write(save_file, json).ok();
         }
     }
+    emit_state(&game, &args);
 }
 
 fn execute_headless_move(game: &mut Game, move_cmd: &str, args: &Args) -> Result<(), String> {
@@ -645,6 +728,20 @@ fn show_legal_moves(game: &mut Game, army: Army) {
     }
 }
 
+/// `army_name` is echoed back as given, like the text-mode wrappers did
+fn show_legal_moves_json(game: &mut Game, army: Army, army_name: &str) {
+    let moves: Vec<_> = game.legal_moves(army).iter()
+        .map(|mv| serde_json::json!({ "from": square_name(mv.from), "to": square_name(mv.to) }))
+        .collect();
+    println!("{}", serde_json::json!({ "army": army_name, "moves": moves }));
+}
+
+fn square_name(square: u8) -> String {
+    let file = (b'a' + (square % 8)) as char;
+    let rank = (b'1' + (square / 8)) as char;
+    format!("{}{}", file, rank)
+}
+
 fn run_batch(game: &mut Game, batch_file: &str, args: &Args) {
     use std::fs;
     
@@ -719,12 +816,65 @@ fn run_batch(game: &mut Game, batch_file: &str, args: &Args) {
     }
     
     // Save state if specified
-    if let Some(save_file) = &args.state {
+    if let Some(save_file) = args.state_file() {
         if let Ok(json) = game.to_json() {
             fs::write(save_file, json).ok();
             println!("\nGame saved to {}", save_file);
         }
     }
+    emit_state(game, args);
+}
+
+/// First line printed by `--serve`, so wrappers can detect support for it
+const SERVE_BANNER: &str = "ENOCH-SERVE 1";
+
+/// Marker printed on stdout and stderr after every served command
+const SERVE_SENTINEL: &str = "---END---";
+
+fn run_serve() {
+    use std::io::{self, BufRead, Write};
+    
+    SERVING.store(true, std::sync::atomic::Ordering::Relaxed);
+    println!("{}", SERVE_BANNER);
+    io::stdout().flush().ok();
+    
+    let stdin = io::stdin();
+    let mut input = String::new();
+    loop {
+        input.clear();
+        match stdin.lock().read_line(&mut input) {
+            Ok(0) | Err(_) => break,
+            Ok(_) => {}
+        }
+        
+        let line = input.trim_end_matches(['\r', '\n']);
+        if line.is_empty() {
+            continue;
+        }
+        
+        // Commands that fail hard still call process::exit, which ends the
+        // session; the wrapper notices the closed pipe and starts a new one.
+        let argv = std::iter::once("enoch").chain(line.split('\t'));
+        let code = match Args::try_parse_from(argv) {
+            Ok(cmd_args) => {
+                run_headless(cmd_args);
+                0
+            }
+            Err(e) => {
+                eprintln!("{}", e);
+                // Skip the state line the unparsed command would have read
+                let tokens: Vec<&str> = line.split('\t').collect();
+                if tokens.windows(2).any(|pair| pair == ["--state", "-"]) {
+                    read_stdin_state();
+                }
+                e.exit_code()
+            }
+        };
+        
+        println!("{}\tcode={}", SERVE_SENTINEL, code);
+        eprintln!("{}", SERVE_SENTINEL);
+        io::stdout().flush().ok();
+    }
 }
 
 fn run_interactive(game: &mut Game, ai_armies: &[Army], args: &Args) {
@@ -895,12 +1045,13 @@ fn run_interactive(game: &mut Game, ai_armies: &[Army], args: &Args) {
     }
     
     // Save state if specified
-    if let Some(save_file) = &args.state {
+    if let Some(save_file) = args.state_file() {
         if let Ok(json) = game.to_json() {
             std::fs::write(save_file, json).ok();
             println!("Game saved to {}", save_file);
         }
     }
+    emit_state(game, args);
 }
 
 fn import_pgn(pgn_file: &str) -> Game {
@@ -1040,7 +1191,7 @@ fn export_pgn(game: &Game, output_file: &str) {
 }
 
 fn show_stats(game: &Game) {
-    use crate::engine::types::{Army, PieceKind};
+    use crate::engine::types::Army;
     
     println!("Game Statistics\n");
     
@@ -1049,6 +1200,42 @@ fn show_stats(game: &Game) {
     
     // Captures (inferred from missing pieces)
     println!("\nCaptures:");
+    for &army in Army::ALL.iter() {
+        println!("  {} lost: {}", army.display_name(), lost_summary(game, army));
+    }
+    
+    // Army status
+    println!("\nArmy Status:");
+    for &army in Army::ALL.iter() {
+        println!("  {}: {}", army.display_name(), army_status(game, army));
+    }
+    
+    // Winner
+    if let Some(team) = game.winning_team() {
+        println!("\n🏆 Winner: {} team", team.name());
+    }
+}
+
+fn show_stats_json(game: &Game) {
+    let mut captures = serde_json::Map::new();
+    let mut status = serde_json::Map::new();
+    for &army in Army::ALL.iter() {
+        captures.insert(army.display_name().to_string(), lost_summary(game, army).into());
+        status.insert(army.display_name().to_string(), army_status(game, army).into());
+    }
+    
+    println!("{}", serde_json::json!({
+        "moves_played": game.move_history.len(),
+        "captures": captures,
+        "status": status,
+    }));
+}
+
+/// Pieces an army has lost, inferred from its starting complement
+/// (e.g. "2 (1×Pawn, 1×Knight)", or "0")
+fn lost_summary(game: &Game, army: Army) -> String {
+    use crate::engine::types::PieceKind;
+    
     let initial_counts: [(PieceKind, usize); 6] = [
         (PieceKind::King, 1),
         (PieceKind::Queen, 1),
@@ -1058,43 +1245,33 @@ fn show_stats(game: &Game) {
         (PieceKind::Pawn, 8),
     ];
     
-    for &army in Army::ALL.iter() {
-        let counts = game.board.piece_counts(army);
-        let mut captured = Vec::new();
-        let mut total_captured = 0;
-        
-        for &(kind, initial) in &initial_counts {
-            let current = counts[kind.index()] as usize;
-            let lost = initial.saturating_sub(current);
-            if lost > 0 {
-                captured.push(format!("{}×{}", lost, kind.name()));
-                total_captured += lost;
-            }
-        }
-        
-        if total_captured > 0 {
-            println!("  {} lost: {} ({})", army.display_name(), total_captured, captured.join(", "));
-        } else {
-            println!("  {} lost: 0", army.display_name());
+    let counts = game.board.piece_counts(army);
+    let mut captured = Vec::new();
+    let mut total_captured = 0;
+    
+    for &(kind, initial) in &initial_counts {
+        let current = counts[kind.index()] as usize;
+        let lost = initial.saturating_sub(current);
+        if lost > 0 {
+            captured.push(format!("{}×{}", lost, kind.name()));
+            total_captured += lost;
         }
     }
     
-    // Army status
-    println!("\nArmy Status:");
-    for &army in Army::ALL.iter() {
-        let status = if game.army_is_frozen(army) {
-            "Frozen"
-        } else if game.king_in_check(army) {
-            "In Check"
-        } else {
-            "Active"
-        };
-        println!("  {}: {}", army.display_name(), status);
+    if total_captured > 0 {
+        format!("{} ({})", total_captured, captured.join(", "))
+    } else {
+        "0".to_string()
     }
-    
-    // Winner
-    if let Some(team) = game.winning_team() {
-        println!("\n🏆 Winner: {} team", team.name());
+}
+
+fn army_status(game: &Game, army: Army) -> &'static str {
+    if game.army_is_frozen(army) {
+        "Frozen"
+    } else if game.king_in_check(army) {
+        "In Check"
+    } else {
+        "Active"
     }
 }
 
@@ -1214,15 +1391,36 @@ fn show_status(game: &Game) {
     }
 }
 
+fn show_status_json(game: &Game) {
+    let mut armies = serde_json::Map::new();
+    for &army in Army::ALL.iter() {
+        armies.insert(army.display_name().to_string(), army_status(game, army).into());
+    }
+    
+    println!("{}", serde_json::json!({
+        "current_turn": game.current_army().display_name(),
+        "armies": armies,
+        "winner": game.winning_team().map(|team| format!("{} team", team.name())),
+    }));
+}
+
 fn show_board(game: &Game) {
     for row in game.board.ascii_rows() {
         println!("{}", row);
     }
 }
 
-fn list_arrays() {
+fn list_arrays(json: bool) {
     use crate::engine::arrays::available_arrays;
     
+    if json {
+        let arrays: Vec<_> = available_arrays().iter()
+            .map(|array| serde_json::json!({ "name": array.name, "description": array.description }))
+            .collect();
+        println!("{}", serde_json::json!({ "arrays": arrays }));
+        return;
+    }
+    
     println!("Available starting arrays:\n");
     for (i, array) in available_arrays().iter().enumerate() {
         println!("{}. {}", i + 1, array.name);
@@ -1280,14 +1478,26 @@ fn convert_format(game: &Game, format: &str) {
     }
 }
 
-fn run_perft(game: &mut Game, depth: u8) {
+fn run_perft(game: &mut Game, depth: u8, json: bool) {
     use std::time::Instant;
     
-    println!("Running perft({})", depth);
+    if !json {
+        println!("Running perft({})", depth);
+    }
     let start = Instant::now();
     let nodes = perft(game, depth);
     let elapsed = start.elapsed();
     
+    if json {
+        println!("{}", serde_json::json!({
+            "depth": depth,
+            "nodes": nodes,
+            "time_seconds": elapsed.as_secs_f64(),
+            "nps": (nodes as f64 / elapsed.as_secs_f64()) as u64,
+        }));
+        return;
+    }
+    
     println!("Nodes: {}", nodes);
     println!("Time: {:.3}s", elapsed.as_secs_f64());
     println!("NPS: {:.0}", nodes as f64 / elapsed.as_secs_f64());
@@ -1391,14 +1601,18 @@ fn generate_position(gen_str: &str, args: &Args) {
         }
     }
     
-    if let Some(save_file) = &args.state {
+    if let Some(save_file) = args.state_file() {
         if let Ok(json) = game.to_json() {
             fs::write(save_file, json).ok();
             println!("✓ Saved to {}", save_file);
         }
     }
+    emit_state(&game, args);
 }
 
+// enoch-mcp/src/enoch_mcp/rules.json caches these answers for common
+// queries; regenerate it when the wording here changes (tests/headless_cli.rs
+// fails until it is)
 fn query_rules(query: &str) {
     let q = query.to_lowercase();
     
@@ -1523,86 +1737,179 @@ fn analyze_square(game: &mut Game, square_str: &str) {
     }
 }
 
-fn validate_move(game: &mut Game, move_cmd: &str) {
+fn analyze_square_json(game: &mut Game, square_str: &str) {
+    use crate::engine::types::PieceKind;
+    
+    let square = match parse_square_headless(square_str.trim()) {
+        Ok(sq) => sq,
+        Err(e) => {
+            // Report the error in-band; exiting would end a --serve session
+            println!("{}", serde_json::json!({
+                "square": square_str,
+                "piece": null,
+                "status": null,
+                "legal_moves": [],
+                "error": format!("Invalid square: {}", e),
+            }));
+            return;
+        }
+    };
+    
+    let report = if let Some((army, kind)) = game.board.piece_at(square) {
+        let status = if game.army_is_frozen(army) {
+            "Frozen"
+        } else if game.king_in_check(army) && kind == PieceKind::King {
+            "In Check"
+        } else {
+            "Active"
+        };
+        let legal_moves: Vec<String> = game.legal_moves(army).iter()
+            .filter(|m| m.from == square)
+            .map(|m| square_name(m.to))
+            .collect();
+        serde_json::json!({
+            "square": square_str,
+            "piece": format!("{} {}", army.display_name(), kind.name()),
+            "status": status,
+            "legal_moves": legal_moves,
+        })
+    } else {
+        serde_json::json!({
+            "square": square_str,
+            "piece": null,
+            "status": "empty",
+            "legal_moves": [],
+        })
+    };
+    
+    println!("{}", report);
+}
+
+/// Outcome of `--validate`, rendered as text or JSON
+struct MoveCheck {
+    valid: bool,
+    message: String,
+    piece: Option<String>,
+    captures: Option<String>,
+    reason: Option<String>,
+}
+
+impl MoveCheck {
+    fn rejected(message: String) -> Self {
+        MoveCheck { valid: false, message, piece: None, captures: None, reason: None }
+    }
+}
+
+fn validate_move(game: &mut Game, move_cmd: &str, json: bool) {
+    let check = check_move(game, move_cmd);
+    
+    if json {
+        let report = if check.valid {
+            serde_json::json!({ "valid": true, "piece": check.piece, "captures": check.captures })
+        } else {
+            let reason = match &check.reason {
+                Some(reason) => format!("{} ({})", check.message, reason),
+                None => check.message.clone(),
+            };
+            serde_json::json!({ "valid": false, "reason": reason })
+        };
+        // "valid" carries the verdict, so don't exit and end a --serve session
+        println!("{}", report);
+        return;
+    }
+    
+    if check.valid {
+        println!("✓ {}", check.message);
+        if let Some(piece) = &check.piece {
+            println!("  Piece: {}", piece);
+        }
+        if let Some(captures) = &check.captures {
+            println!("  Captures: {}", captures);
+        }
+    } else {
+        println!("❌ {}", check.message);
+        if let Some(reason) = &check.reason {
+            println!("  Reason: {}", reason);
+        }
+    }
+    
+    if !check.valid {
+        process::exit(1);
+    }
+}
+
+fn check_move(game: &mut Game, move_cmd: &str) -> MoveCheck {
     let parts: Vec<&str> = move_cmd.split(':').collect();
     if parts.len() != 2 {
-        println!("❌ Invalid format. Use: army: e2-e4");
-        process::exit(1);
+        return MoveCheck::rejected("Invalid format. Use: army: e2-e4".to_string());
     }
     
     let army = match Army::from_str(parts[0].trim()) {
         Some(a) => a,
-        None => {
-            println!("❌ Unknown army: {}", parts[0].trim());
-            process::exit(1);
-        }
+        None => return MoveCheck::rejected(format!("Unknown army: {}", parts[0].trim())),
     };
     
     let move_part = parts[1].trim().replace('x', "-");
     let coords: Vec<&str> = move_part.split('-').collect();
     if coords.len() != 2 {
-        println!("❌ Invalid move format. Use: e2-e4");
-        process::exit(1);
+        return MoveCheck::rejected("Invalid move format. Use: e2-e4".to_string());
     }
     
     let from = match parse_square_headless(coords[0].trim()) {
         Ok(sq) => sq,
-        Err(e) => {
-            println!("❌ Invalid source square: {}", e);
-            process::exit(1);
-        }
+        Err(e) => return MoveCheck::rejected(format!("Invalid source square: {}", e)),
     };
     
     let to = match parse_square_headless(coords[1].trim()) {
         Ok(sq) => sq,
-        Err(e) => {
-            println!("❌ Invalid destination square: {}", e);
-            process::exit(1);
-        }
+        Err(e) => return MoveCheck::rejected(format!("Invalid destination square: {}", e)),
     };
     
     // Check if it's the army's turn
     if game.current_army() != army {
-        println!("❌ Not {}'s turn (current: {})", 
-            army.display_name(), game.current_army().display_name());
-        process::exit(1);
+        return MoveCheck::rejected(format!("Not {}'s turn (current: {})", 
+            army.display_name(), game.current_army().display_name()));
     }
     
     // Check if army is frozen
     if game.army_is_frozen(army) {
-        println!("❌ {} is frozen", army.display_name());
-        process::exit(1);
+        return MoveCheck::rejected(format!("{} is frozen", army.display_name()));
     }
     
     // Check if move is legal
     if game.is_legal_move(army, from, to) {
-        println!("✓ Valid move: {} {} → {}", 
-            army.display_name(), coords[0], coords[1]);
+        let mut check = MoveCheck {
+            valid: true,
+            message: format!("Valid move: {} {} → {}", army.display_name(), coords[0], coords[1]),
+            piece: None,
+            captures: None,
+            reason: None,
+        };
         
         // Show what piece is moving
         if let Some((piece_army, piece_kind)) = game.board.piece_at(from) {
-            println!("  Piece: {}", piece_kind.name());
+            check.piece = Some(piece_kind.name().to_string());
             
             // Check if it's a capture
             if let Some((target_army, target_kind)) = game.board.piece_at(to) {
-                println!("  Captures: {} {}", target_army.display_name(), target_kind.name());
+                check.captures = Some(format!("{} {}", target_army.display_name(), target_kind.name()));
             }
         }
+        check
     } else {
-        println!("❌ Illegal move: {} {} → {}", 
-            army.display_name(), coords[0], coords[1]);
+        let mut check = MoveCheck::rejected(format!("Illegal move: {} {} → {}", 
+            army.display_name(), coords[0], coords[1]));
         
         // Provide helpful context
-        if let Some((piece_army, piece_kind)) = game.board.piece_at(from) {
+        check.reason = Some(if let Some((piece_army, piece_kind)) = game.board.piece_at(from) {
             if piece_army != army {
-                println!("  Reason: That piece belongs to {}", piece_army.display_name());
+                format!("That piece belongs to {}", piece_army.display_name())
             } else {
-                println!("  Reason: {} cannot move there", piece_kind.name());
+                format!("{} cannot move there", piece_kind.name())
             }
         } else {
-            println!("  Reason: No piece at {}", coords[0]);
-        }
-        
-        process::exit(1);
+            format!("No piece at {}", coords[0])
+        });
+        check
     }
 }
@@ -0,0 +1,229 @@
+use std::io::Write;
+use std::process::{Command, Output, Stdio};
+
+const SENTINEL: &str = "---END---";
+
+fn enoch(args: &[&str], stdin: &str) -> Output {
+    let mut child = Command::new(env!("CARGO_BIN_EXE_enoch"))
+        .arg("--headless")
+        .args(args)
+        .stdin(Stdio::piped())
+        .stdout(Stdio::piped())
+        .stderr(Stdio::piped())
+        .spawn()
+        .expect("failed to start enoch");
+    child
+        .stdin
+        .take()
+        .unwrap()
+        .write_all(stdin.as_bytes())
+        .unwrap();
+    child.wait_with_output().unwrap()
+}
+
+fn stdout_of(output: &Output) -> String {
+    String::from_utf8(output.stdout.clone()).unwrap()
+}
+
+/// Split served stdout into (output, exit code) frames, checking the banner
+fn serve_frames(stdout: &str) -> Vec<(String, i32)> {
+    let mut lines = stdout.lines();
+    assert_eq!(lines.next(), Some("ENOCH-SERVE 1"));
+
+    let mut frames = Vec::new();
+    let mut frame = String::new();
+    for line in lines {
+        if let Some(code) = line.strip_prefix(&format!("{}\tcode=", SENTINEL)) {
+            frames.push((std::mem::take(&mut frame), code.parse().unwrap()));
+        } else {
+            frame.push_str(line);
+            frame.push('\n');
+        }
+    }
+    assert!(frame.is_empty(), "unframed trailing output: {:?}", frame);
+    frames
+}
+
+#[test]
+fn serve_frames_each_command_with_its_exit_code() {
+    let output = enoch(&["--serve"], "--status\n--perft\tx\n\n--perft\t1\n");
+    assert!(output.status.success());
+
+    let frames = serve_frames(&stdout_of(&output));
+    assert_eq!(frames.len(), 3);
+    assert!(frames[0].0.contains("Current turn: Blue"));
+    assert_eq!(frames[0].1, 0);
+    assert_eq!(frames[1], (String::new(), 2));
+    assert!(frames[2].0.contains("Nodes:"));
+    assert_eq!(frames[2].1, 0);
+
+    // stderr is framed too, one sentinel per command
+    let stderr = String::from_utf8(output.stderr).unwrap();
+    let err_frames: Vec<&str> = stderr.split(&format!("{}\n", SENTINEL)).collect();
+    assert_eq!(err_frames.len(), 4);
+    assert!(err_frames[0].is_empty());
+    assert!(err_frames[1].contains("invalid value 'x'"));
+    assert!(err_frames[2].is_empty());
+}
+
+#[test]
+fn serve_session_ends_when_a_command_exits() {
+    let output = enoch(&["--serve"], "--move\tblue: e9-e3\n--status\n");
+    assert_eq!(output.status.code(), Some(1));
+
+    let stdout = stdout_of(&output);
+    assert_eq!(stdout.trim(), "ENOCH-SERVE 1");
+    assert!(!stdout.contains("Current turn"));
+}
+
+fn json_of(output: &Output) -> serde_json::Value {
+    serde_json::from_str(&stdout_of(output)).expect("expected one JSON document on stdout")
+}
+
+#[test]
+fn json_status_matches_text_status() {
+    let json = json_of(&enoch(&["--status", "--json"], ""));
+    let text = stdout_of(&enoch(&["--status"], ""));
+
+    assert!(text.contains(&format!("Current turn: {}", json["current_turn"].as_str().unwrap())));
+    for (army, status) in json["armies"].as_object().unwrap() {
+        assert!(text.contains(&format!("{}: {}", army, status.as_str().unwrap())));
+    }
+}
+
+#[test]
+fn json_perft_matches_text_perft() {
+    let json = json_of(&enoch(&["--perft", "2", "--json"], ""));
+    let text = stdout_of(&enoch(&["--perft", "2"], ""));
+
+    assert_eq!(json["depth"], 2);
+    assert!(text.contains(&format!("Nodes: {}\n", json["nodes"])));
+}
+
+#[test]
+fn json_legal_moves_echo_the_army_and_match_text() {
+    let json = json_of(&enoch(&["--legal-moves", "blue", "--json"], ""));
+    let text = stdout_of(&enoch(&["--legal-moves", "blue"], ""));
+
+    assert_eq!(json["army"], "blue");
+    let moves = json["moves"].as_array().unwrap();
+    assert!(!moves.is_empty());
+    for mv in moves {
+        let line = format!("{} -> {}", mv["from"].as_str().unwrap(), mv["to"].as_str().unwrap());
+        assert!(text.contains(&line), "missing {:?} in text output", line);
+    }
+}
+
+#[test]
+fn json_rejections_are_reported_without_exiting() {
+    let output = enoch(&["--validate", "blue: e2-e5", "--json"], "");
+    assert!(output.status.success());
+    let report = json_of(&output);
+    assert_eq!(report["valid"], false);
+    assert!(report["reason"].as_str().unwrap().contains("Pawn cannot move there"));
+
+    let output = enoch(&["--analyze", "z9", "--json"], "");
+    assert!(output.status.success());
+    let report = json_of(&output);
+    assert_eq!(report["square"], "z9");
+    assert!(report["error"].as_str().unwrap().starts_with("Invalid square"));
+    // Same keys as a successful report, so callers can index them
+    assert!(report["piece"].is_null());
+    assert!(report["status"].is_null());
+    assert_eq!(report["legal_moves"], serde_json::json!([]));
+
+    // The text forms still fail with a non-zero exit code
+    assert_eq!(enoch(&["--validate", "blue: e2-e5"], "").status.code(), Some(1));
+
+    // and a served session keeps going after a JSON rejection
+    let output = enoch(&["--serve"], "--validate\tblue: e2-e5\t--json\n--validate\tblue: e2-e3\t--json\n");
+    let frames = serve_frames(&stdout_of(&output));
+    assert_eq!(frames.len(), 2);
+    assert!(frames[0].0.contains("\"valid\":false"));
+    assert!(frames[1].0.contains("\"valid\":true"));
+}
+
+/// The state printed after the ---STATE--- marker by --emit-state
+fn emitted_state(stdout: &str) -> String {
+    let (_, state) = stdout.split_once("---STATE---\n").expect("no emitted state");
+    let state = state.trim_end();
+    assert!(!state.contains('\n'), "emitted state should be one line");
+    state.to_string()
+}
+
+#[test]
+fn state_round_trips_through_stdin() {
+    let output = enoch(&["--move", "blue: e2-e3", "--state", "-", "--emit-state"], "");
+    assert!(output.status.success());
+    let state = emitted_state(&stdout_of(&output));
+    assert!(!std::path::Path::new("-").exists());
+
+    let status = stdout_of(&enoch(&["--status", "--state", "-"], &state));
+    assert!(status.contains("Current turn: Red"));
+
+    // Pretty-printed state files span many lines and must load the same way
+    let value: serde_json::Value = serde_json::from_str(&state).unwrap();
+    let pretty = serde_json::to_string_pretty(&value).unwrap();
+    let status = stdout_of(&enoch(&["--status", "--state", "-"], &pretty));
+    assert!(status.contains("Current turn: Red"));
+}
+
+#[test]
+fn served_commands_read_one_state_line_each() {
+    let output = enoch(&["--move", "blue: e2-e3", "--state", "-", "--emit-state"], "");
+    let state = emitted_state(&stdout_of(&output));
+
+    let input = format!(
+        "--status\t--state\t-\n{state}\n--perft\tx\t--state\t-\n{state}\n--status\t--state\t-\n\n",
+        state = state
+    );
+    let frames = serve_frames(&stdout_of(&enoch(&["--serve"], &input)));
+    assert_eq!(frames.len(), 3);
+    assert!(frames[0].0.contains("Current turn: Red"));
+    // A command that fails to parse still consumes its state line
+    assert_eq!(frames[1].1, 2);
+    assert!(frames[2].0.contains("Current turn: Blue"));
+}
+
+#[test]
+fn invalid_stdin_state_is_an_error() {
+    let output = enoch(&["--status", "--state", "-", "--emit-state"], "{");
+    assert_eq!(output.status.code(), Some(1));
+    assert!(!stdout_of(&output).contains("---STATE---"));
+    assert!(String::from_utf8(output.stderr).unwrap().contains("invalid game state"));
+}
+
+#[test]
+fn perft_text_output_ends_with_the_totals() {
+    // enoch-mcp's legacy perft parser only reads the last few lines
+    let stdout = stdout_of(&enoch(&["--perft", "2"], ""));
+    let lines: Vec<&str> = stdout.lines().collect();
+    let tail = &lines[lines.len() - 3..];
+
+    assert_eq!(tail[0], "Nodes: 225");
+    let time = tail[1].strip_prefix("Time: ").and_then(|t| t.strip_suffix('s')).unwrap();
+    assert!(time.parse::<f64>().is_ok(), "bad time line {:?}", tail[1]);
+    let nps = tail[2].strip_prefix("NPS: ").unwrap();
+    assert!(nps.parse::<u64>().is_ok(), "bad NPS line {:?}", tail[2]);
+}
+
+#[test]
+fn bundled_rules_answers_match_query_output() {
+    // enoch-mcp answers these queries without running enoch
+    let rules: serde_json::Map<String, serde_json::Value> = serde_json::from_str(include_str!(concat!(
+        env!("CARGO_MANIFEST_DIR"),
+        "/enoch-mcp/src/enoch_mcp/rules.json"
+    )))
+    .unwrap();
+    assert!(!rules.is_empty());
+
+    for (query, answer) in &rules {
+        let output = enoch(&["--query", query], "");
+        assert_eq!(
+            stdout_of(&output).trim(),
+            answer.as_str().unwrap(),
+            "rules.json is stale for {:?}",
+            query
+        );
+    }
+}